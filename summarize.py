@@ -2,22 +2,64 @@
 """
 Aggregate JSON practice logs from subdirectories only, grouped by top-level folder,
 restricted to files within the last N months based on path date: [domain]/YYYY/MM/DD.json
+(or, with --no-enforce-date-path, every JSON file below a top-level folder).
 """
 
 from __future__ import annotations
 import argparse
 import json
+import mmap
 import os
+import re
+import shutil
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, date
 from calendar import monthrange
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
+
+def _json_dumps(obj) -> bytes:
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+def _json_dumps_line(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    # orjson refuses values nested deeper than 255 levels, which stdlib json
+    # handles; fall back per call so such logs are still written.
+    def _dumps(obj) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return _json_dumps(obj)
+
+    def _dumps_line(obj) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            return _json_dumps_line(obj)
+else:
+    _loads = json.loads
+    _dumps = _json_dumps
+    _dumps_line = _json_dumps_line
+
+# Files above this size are mapped rather than read (orjson parses the mapping
+# in place; stdlib json needs a bytes copy, so it always reads).
+MMAP_THRESHOLD = 1 << 20
+
+# Items sit at depth 3 of the aggregated document: {"groups": {"<domain>": [
+_ITEM_INDENT = b"\n      "
 
 DEFAULT_EXCLUDES = {".git", ".hg", ".svn", "node_modules", ".venv", "venv", "__pycache__"}
 
-def is_json(path: Path) -> bool:
-    return path.suffix.lower() == ".json"
-
 def months_ago(d: date, months: int) -> date:
     """Return the calendar date `months` months before `d` (clamped to month length)."""
     y = d.year
@@ -28,33 +70,279 @@ def months_ago(d: date, months: int) -> date:
     _, max_day = monthrange(y, m)
     return date(y, m, min(d.day, max_day))
 
-def parse_path_date(repo_path: Path, fpath: Path):
+# [domain]/YYYY/MM/DD.json, relative to the repo root
+_PATH_RE = re.compile(r"([^/\\]+)[/\\](\d{4})[/\\](\d{2})[/\\](\d{2})\.json", re.IGNORECASE)
+
+# Classifier result for a well-formed path dated outside the window
+_OUT_OF_WINDOW = object()
+
+def _classify_date_window(cutoff_t: tuple, today_t: tuple):
     """
-    Expect relative path format: [domain]/YYYY/MM/DD.json
-    Returns (domain, file_date) or (None, None) if not matching/invalid.
+    Build the classifier for [domain]/YYYY/MM/DD.json paths dated within
+    [cutoff_t, today_t]; the bounds are bound once as closure cells.
+
+    The classifier takes a path relative to the repo root and returns
+    (domain, log_date) when in window, _OUT_OF_WINDOW when dated outside it,
+    or None when the path doesn't match the structure (including impossible
+    dates such as 02/30 in the window).
     """
+    fullmatch = _PATH_RE.fullmatch
+
+    def classify(rel: str):
+        m = fullmatch(rel)
+        if m is None:
+            return None
+        domain, y, mo, dd = m.groups()
+        ymd = (int(y), int(mo), int(dd))
+        if not (cutoff_t <= ymd <= today_t):
+            return _OUT_OF_WINDOW
+        try:
+            return domain, date(*ymd).isoformat()
+        except ValueError:
+            return None
+
+    return classify
+
+def _classify_dateless(rel: str):
+    """Classifier without the date structure: group by top-level folder only."""
+    return rel.split(os.sep, 1)[0], None
+
+# Where supported, scan through an open directory fd so DirEntry.stat() is an
+# fstatat() relative to that fd instead of a full path lookup per file.
+_SCAN_WITH_DIRFD = os.scandir in os.supports_fd
+
+def _scandir(top: str):
+    """Open `top` for scanning; returns (iterator, dir_fd or None)."""
+    if not _SCAN_WITH_DIRFD:
+        return os.scandir(top), None
+    fd = os.open(top, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
     try:
-        rel = fpath.relative_to(repo_path)
-    except ValueError:
-        return None, None
-
-    parts = rel.parts
-    if len(parts) != 4 or not is_json(fpath):
-        return None, None
+        return os.scandir(fd), fd
+    except OSError:
+        os.close(fd)
+        raise
 
-    domain, y, m, dd_json = parts
-    if not (y.isdigit() and m.isdigit()):
-        return None, None
+def _scan(root: Path, excludes: set[str], follow: bool):
+    """
+    Walk `root` with os.scandir, yielding (path str, DirEntry) for every JSON file
+    below the top level. The DirEntry is passed along so callers can reuse its
+    cached stat() instead of issuing a second syscall; call it before advancing
+    the generator, since it may be resolved relative to the directory's fd.
+    """
+    stack = [(str(root), 0)]
+    while stack:
+        top, depth = stack.pop()
+        try:
+            it, fd = _scandir(top)
+        except OSError:
+            continue  # unreadable directory; os.walk ignored these too
+        subdirs = []
+        try:
+            with it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=follow):
+                        # prune excluded directories
+                        if e.name not in excludes:
+                            subdirs.append((os.path.join(top, e.name), depth + 1))
+                    elif depth and e.is_file() and e.name.lower().endswith(".json"):
+                        # Skip root-level files; only process subdirs
+                        yield os.path.join(top, e.name), e
+        finally:
+            if fd is not None:
+                os.close(fd)
+        # Reversed so subdirectories pop in listing order, as os.walk visits them
+        stack.extend(reversed(subdirs))
+
+def _read_file(fpath: str, size: int) -> bytearray:
+    """
+    Read a whole file with unbuffered readinto() calls into a buffer sized
+    from the scan's stat, looping over short reads (large files, network
+    filesystems). The spare byte detects a file that grew since the scan.
+    """
+    buf = bytearray(size + 1)
+    n = 0
+    with open(fpath, "rb", buffering=0) as f:
+        with memoryview(buf) as view:
+            while n <= size:
+                got = f.readinto(view[n:])
+                if not got:
+                    break
+                n += got
+        if n <= size:
+            del buf[n:]  # shrank since the scan
+        else:
+            buf += f.readall()  # grew since the scan
+    return buf
+
+# A run of 19+ digits may be an integer wider than 64 bits, which orjson would
+# silently turn into a float; such files are decoded by stdlib json instead.
+_WIDE_NUMBER = re.compile(rb"\d{19}")
+
+def _decode(raw):
+    """
+    Parse the bytes-like `raw`; returns (data, via_orjson). orjson is used only
+    where it round-trips exactly: files with very wide numbers, or that orjson
+    rejects (NaN/Infinity, which stdlib json accepts), go through stdlib json,
+    and must then be encoded with stdlib json too.
+    """
+    if orjson is not None and _WIDE_NUMBER.search(raw) is None:
+        try:
+            return orjson.loads(raw), True
+        except orjson.JSONDecodeError:
+            pass  # stdlib json decides, and reports real errors in its own words
+    return json.loads(bytes(raw) if isinstance(raw, memoryview) else raw), False
+
+def _load_mapped(fpath: str):
+    """Parse a large file straight from a read-only mapping."""
+    with open(fpath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mm) as view:
+            return _decode(view)
+
+def _encode_item(item: dict, fmt: str, via_orjson: bool) -> bytes:
+    """
+    Serialize one item exactly as its writer emits it: an indented element of
+    a "groups" array for fmt "json", or a compact line for fmt "ndjson".
+    """
+    if fmt == "ndjson":
+        return _dumps_line(item) if via_orjson else _json_dumps_line(item)
+    return (_dumps(item) if via_orjson else _json_dumps(item)).replace(b"\n", _ITEM_INDENT)
 
+def _parse_one(task):
+    """
+    Read, parse and serialize one log file. Runs on a reader thread, or in a
+    worker process when --workers > 1, so it only takes and returns picklable
+    values: (encoded item, error). Each item is encoded exactly once, here.
+    """
+    fpath, rel, domain, log_date, modified, size, fmt = task
     try:
-        dd = Path(dd_json).stem
-        if not dd.isdigit():
-            return None, None
-        file_date = date(int(y), int(m), int(dd))
-    except Exception:
-        return None, None
+        if size > MMAP_THRESHOLD and orjson is not None:
+            data, via_orjson = _load_mapped(fpath)
+        else:
+            data, via_orjson = _decode(_read_file(fpath, size))
+    except OSError as e:
+        # vanished or unreadable since the scan
+        return None, f"{fpath}: {e}"
+    except (ValueError, RecursionError) as e:
+        # json.JSONDecodeError, bad UTF-8 or too-deep nesting under stdlib json
+        return None, f"{fpath}: JSON decode error: {e}"
+
+    if isinstance(data, dict):
+        item = data
+    elif isinstance(data, list):
+        item = {"logs": data}
+    else:
+        return None, f"{fpath}: Unsupported JSON root type: {type(data).__name__}"
+
+    item["_source_file"] = rel
+    item["_file_modified"] = modified
+    item["_group"] = domain
+    if log_date is not None:
+        item["_log_date"] = log_date
+    try:
+        return _encode_item(item, fmt, via_orjson), None
+    except (ValueError, RecursionError) as e:
+        # nested deeper than the encoder allows, or lone surrogates in strings
+        return None, f"{fpath}: cannot be written back out: {e}"
+
+# Cache layout: this magic line, one JSON index line listing
+# [rel, mtime_ns, size, log_date, fmt, n] per file, then the files' encoded
+# items back to back, n bytes each. Plain JSON, never pickle: the file may sit
+# in a shared checkout, and items are spliced into the output without decoding.
+_CACHE_MAGIC = b"summarize.py item cache v1\n"
+
+def cache_path(output_file: Path) -> Path:
+    """Default cache location, next to the output file."""
+    return output_file.with_name(output_file.name + ".cache")
+
+def load_cache(cache_file: Path) -> dict:
+    """
+    Load the encoded-item cache as {rel: (mtime_ns, size, log_date, fmt, item
+    bytes)}. A missing cache is empty; a damaged one is ignored as a whole.
+    """
+    try:
+        data = cache_file.read_bytes()
+    except FileNotFoundError:
+        return {}
+    except OSError as e:
+        print(f"⚠️ Ignoring unreadable cache {cache_file}: {e}")
+        return {}
+    if not data.startswith(_CACHE_MAGIC):
+        print(f"⚠️ Ignoring cache {cache_file}: unrecognized format")
+        return {}
+    cache = {}
+    try:
+        eol = data.find(b"\n", len(_CACHE_MAGIC))
+        if eol < 0:
+            raise ValueError("truncated index")
+        pos = eol + 1
+        for rel, mtime_ns, size, log_date, fmt, n in _loads(data[len(_CACHE_MAGIC):eol]):
+            if not (isinstance(rel, str) and isinstance(n, int) and 0 <= n <= len(data) - pos):
+                raise ValueError("bad index entry")
+            cache[rel] = (mtime_ns, size, log_date, fmt, data[pos:pos + n])
+            pos += n
+    except (ValueError, TypeError, RecursionError) as e:
+        print(f"⚠️ Ignoring damaged cache {cache_file}: {e}")
+        return {}
+    return cache
+
+def save_cache(cache_file: Path, cache: dict) -> None:
+    """Write the cache atomically so an interrupted run can't corrupt it."""
+    index = []
+    items = []
+    for rel, (mtime_ns, size, log_date, fmt, item) in cache.items():
+        try:
+            rel.encode("utf-8")
+        except UnicodeEncodeError:
+            continue  # undecodable file name; it is simply re-parsed next run
+        index.append([rel, mtime_ns, size, log_date, fmt, len(item)])
+        items.append(item)
+    tmp = cache_file.with_name(cache_file.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_CACHE_MAGIC)
+        f.write(_dumps_line(index))
+        f.writelines(items)
+    os.replace(tmp, cache_file)
+
+def _indented(obj, prefix: bytes) -> bytes:
+    """Serialize `obj` with indent=2, shifted right so it nests under `prefix`."""
+    return _dumps(obj).replace(b"\n", b"\n" + prefix)
+
+def write_aggregated(output_file: Path, metadata: dict, groups: Dict[str, List[bytes]]) -> None:
+    """
+    Stream the aggregated document to disk, splicing in items already encoded
+    by _encode_item. Output matches json.dump(indent=2).
+    """
+    with open(output_file, "wb") as f:
+        f.write(b'{\n  "metadata": ')
+        f.write(_indented(metadata, b"  "))
+        if not groups:
+            f.write(b',\n  "groups": {}\n}')
+            return
+        f.write(b',\n  "groups": {')
+        for i, (domain, items) in enumerate(groups.items()):
+            f.write(b"\n    " if i == 0 else b",\n    ")
+            f.write(_dumps(domain))
+            f.write(b": [")
+            for j, item in enumerate(items):
+                f.write(_ITEM_INDENT if j == 0 else b"," + _ITEM_INDENT)
+                f.write(item)
+            f.write(b"\n    ]")
+        f.write(b"\n  }\n}")
+
+def ndjson_path(output_file: Path) -> Path:
+    """
+    Where --ndjson mode writes the per-item lines next to the metadata file.
+    A suffix has no dots of its own, so this never equals output_file.
+    """
+    return output_file.with_name(output_file.stem + ".groups.ndjson")
 
-    return domain, file_date
+def write_ndjson(groups_file: Path, groups: Dict[str, List[bytes]]) -> None:
+    """One compact JSON object per line; each item already carries its _group."""
+    with open(groups_file, "wb") as f:
+        for items in groups.values():
+            f.writelines(items)
 
 def aggregate_logs(
     repo_path: Path,
@@ -62,121 +350,175 @@ def aggregate_logs(
     excludes: set[str],
     follow_symlinks: bool,
     months: int,
+    workers: int = 1,
+    cache_file: Optional[Path] = None,
+    ndjson: bool = False,
+    enforce_date_path: bool = True,
 ) -> Path:
     repo_path = repo_path.resolve()
     if not repo_path.exists() or not repo_path.is_dir():
         raise ValueError(f"Repository path does not exist or is not a directory: {repo_path}")
 
-    today = date.today()
-    cutoff = months_ago(today, months)
+    if enforce_date_path:
+        today = date.today()
+        cutoff = months_ago(today, months)
+        classify = _classify_date_window(
+            (cutoff.year, cutoff.month, cutoff.day),
+            (today.year, today.month, today.day),
+        )
+    else:
+        today = cutoff = None
+        classify = _classify_dateless
 
-    groups: Dict[str, List[dict]] = {}
     skipped_files: List[str] = []
     counts = {"total_files_found": 0, "total_parsed": 0, "total_skipped": 0, "total_within_window": 0}
-    group_meta: Dict[str, Dict[str, int]] = {}
-
-    print(f"Scanning subdirectories of: {repo_path}")
-    print(f"Time window: files dated from {cutoff.isoformat()} to {today.isoformat()} (inclusive)")
 
-    for dirpath, dirnames, filenames in os.walk(repo_path, followlinks=follow_symlinks):
-        # prune excluded directories
-        dirnames[:] = [d for d in dirnames if d not in excludes]
+    # Per-domain state as parallel arrays indexed by a small domain id
+    domain_to_id: Dict[str, int] = {}
+    found = array("Q")
+    parsed_n = array("Q")
+    skipped_n = array("Q")
 
-        dirpath_p = Path(dirpath)
-        # Skip root-level files; only process subdirs
-        if dirpath_p.resolve() == repo_path:
+    print(f"Scanning subdirectories of: {repo_path}")
+    if enforce_date_path:
+        print(f"Time window: files dated from {cutoff.isoformat()} to {today.isoformat()} (inclusive)")
+    else:
+        print("Time window: none (path dates not enforced)")
+
+    # Phase 1: scan and filter by path date
+    repo_str = os.path.join(str(repo_path), "")
+    fmt = "ndjson" if ndjson else "json"
+    modified_iso: Dict[int, str] = {}  # st_mtime_ns -> isoformat
+    # Items encoded on a previous run, reused while (mtime_ns, size, log date, format) match
+    cache = load_cache(cache_file) if cache_file is not None else {}
+    new_cache = {}
+    # One slot per in-window file, in scan order; cache hits are filled now
+    slots: List[Optional[bytes]] = []
+    slot_dids = array("Q")
+    slot_keys = []
+    tasks = []
+    task_slots = []
+    for fpath, entry in _scan(repo_path, excludes, follow_symlinks):
+        counts["total_files_found"] += 1
+
+        rel = fpath[len(repo_str):]
+        parsed = classify(rel)
+        if parsed is _OUT_OF_WINDOW:
+            continue  # out of window; silently excluded from totals except found
+        if parsed is None:
+            # Not matching the enforced structure; skip but record
+            msg = f"{fpath}: path does not match [domain]/YYYY/MM/DD.json"
+            skipped_files.append(msg)
+            counts["total_skipped"] += 1
             continue
-
-        for fname in filenames:
-            fpath = dirpath_p / fname
-            if not is_json(fpath):
-                continue
-
-            counts["total_files_found"] += 1
-
-            domain, fdate = parse_path_date(repo_path, fpath)
-            if domain is None or fdate is None:
-                # Not matching the enforced structure; skip but record
-                msg = f"{fpath}: path does not match [domain]/YYYY/MM/DD.json"
-                skipped_files.append(msg)
-                counts["total_skipped"] += 1
-                continue
-
-            # Filter by date window
-            if not (cutoff <= fdate <= today):
-                continue  # out of window; silently excluded from totals except found
-            counts["total_within_window"] += 1
-
-            try:
-                with open(fpath, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                if isinstance(data, dict):
-                    item = data
-                elif isinstance(data, list):
-                    item = {"logs": data}
-                else:
-                    raise ValueError(f"Unsupported JSON root type: {type(data).__name__}")
-
-                item["_source_file"] = str(fpath.relative_to(repo_path))
-                item["_file_modified"] = datetime.fromtimestamp(fpath.stat().st_mtime).isoformat()
-                item["_group"] = domain
-                item["_log_date"] = fdate.isoformat()
-
-                groups.setdefault(domain, []).append(item)
-                gm = group_meta.setdefault(domain, {"found_in_window": 0, "parsed": 0, "skipped": 0})
-                gm["found_in_window"] += 1
-                gm["parsed"] += 1
-                counts["total_parsed"] += 1
-
-            except json.JSONDecodeError as e:
-                msg = f"{fpath}: JSON decode error: {e}"
-                skipped_files.append(msg)
-                counts["total_skipped"] += 1
-                gm = group_meta.setdefault(domain, {"found_in_window": 0, "parsed": 0, "skipped": 0})
-                gm["found_in_window"] += 1
-                gm["skipped"] += 1
-            except Exception as e:
-                msg = f"{fpath}: {e}"
-                skipped_files.append(msg)
-                counts["total_skipped"] += 1
-                gm = group_meta.setdefault(domain, {"found_in_window": 0, "parsed": 0, "skipped": 0})
-                gm["found_in_window"] += 1
-                gm["skipped"] += 1
-
-    aggregated = {
-        "metadata": {
-            "aggregated_at": datetime.now().isoformat(),
-            "source_directory": str(repo_path),
-            "excludes": sorted(excludes),
-            "window_months": months,
-            "window_start": cutoff.isoformat(),
-            "window_end": today.isoformat(),
-            **counts,
-            "groups": {
-                g: {
-                    "found_in_window": group_meta.get(g, {}).get("found_in_window", 0),
-                    "parsed": group_meta.get(g, {}).get("parsed", 0),
-                    "skipped": group_meta.get(g, {}).get("skipped", 0),
-                }
-                for g in sorted(groups.keys() | group_meta.keys())
-            },
-            "parsing_errors": skipped_files if skipped_files else [],
-        },
-        "groups": groups,  # { "<domain>": [ { ...item... }, ... ] }
+        domain, log_date = parsed
+        counts["total_within_window"] += 1
+
+        did = domain_to_id.get(domain)
+        if did is None:
+            did = domain_to_id[domain] = len(found)
+            found.append(0)
+            parsed_n.append(0)
+            skipped_n.append(0)
+        found[did] += 1
+
+        try:
+            st = entry.stat()
+        except OSError as e:
+            # vanished since readdir (editor temp files, concurrent checkout)
+            skipped_files.append(f"{fpath}: {e}")
+            skipped_n[did] += 1
+            continue
+        # Bulk copies/commits leave many files with identical mtimes
+        modified = modified_iso.get(st.st_mtime_ns)
+        if modified is None:
+            modified = modified_iso[st.st_mtime_ns] = datetime.fromtimestamp(st.st_mtime).isoformat()
+
+        sig = (st.st_mtime_ns, st.st_size, log_date, fmt)
+        hit = cache.get(rel)
+        item = hit[4] if hit is not None and hit[:4] == sig else None
+        if item is None:
+            task_slots.append(len(slots))
+            tasks.append((
+                fpath,
+                rel,
+                domain,
+                log_date,
+                modified,
+                st.st_size,
+                fmt,
+            ))
+        slots.append(item)
+        slot_dids.append(did)
+        slot_keys.append((rel, sig))
+
+    if cache_file is not None:
+        print(f"Cache: reusing {len(slots) - len(tasks)} of {len(slots)} in-window files")
+
+    # Phase 2: read + parse, optionally across worker processes. In-process,
+    # a thread pool keeps several file reads in flight (reads release the GIL).
+    # Phase 3: merge into groups (always single-threaded).
+    if workers == 1:
+        pool = ThreadPoolExecutor()
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers or None)
+    with pool:
+        for i, (item, err) in zip(task_slots, pool.map(_parse_one, tasks, chunksize=64)):
+            if err is None:
+                slots[i] = item
+            else:
+                skipped_files.append(err)
+                skipped_n[slot_dids[i]] += 1
+    # found[] already holds each domain's in-window count, so size the lists
+    # up front and fill by index; parsed_n[did] doubles as the fill position.
+    items_by_id: List[List[Optional[bytes]]] = [[None] * n for n in found]
+    for did, (rel, sig), item in zip(slot_dids, slot_keys, slots):
+        if item is not None:
+            n = parsed_n[did]
+            items_by_id[did][n] = item
+            parsed_n[did] = n + 1
+            new_cache[rel] = (*sig, item)
+    for did, items in enumerate(items_by_id):
+        del items[parsed_n[did]:]  # drop slots left by skipped files
+    if cache_file is not None:
+        save_cache(cache_file, new_cache)
+    counts["total_parsed"] = sum(parsed_n)
+    counts["total_skipped"] += sum(skipped_n)
+
+    groups = {d: items_by_id[did] for d, did in domain_to_id.items() if items_by_id[did]}
+    group_meta = {
+        d: {"found_in_window": found[did], "parsed": parsed_n[did], "skipped": skipped_n[did]}
+        for d, did in sorted(domain_to_id.items())
     }
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(aggregated, f, indent=2, ensure_ascii=False)
-
-    size_mb = output_file.stat().st_size / (1024 * 1024)
+    metadata = {
+        "aggregated_at": datetime.now().isoformat(),
+        "source_directory": str(repo_path),
+        "excludes": sorted(excludes),
+        "window_months": months if enforce_date_path else None,
+        "window_start": cutoff.isoformat() if enforce_date_path else None,
+        "window_end": today.isoformat() if enforce_date_path else None,
+        **counts,
+        "groups": group_meta,
+        "parsing_errors": skipped_files if skipped_files else [],
+    }
+    if ndjson:
+        # metadata in output_file; items, one per line, in the .ndjson sidecar
+        output_file.write_bytes(_dumps(metadata))
+        write_ndjson(ndjson_path(output_file), groups)
+        outputs = [output_file, ndjson_path(output_file)]
+    else:
+        # { "metadata": {...}, "groups": { "<domain>": [ { ...item... }, ... ] } }
+        write_aggregated(output_file, metadata, groups)
+        outputs = [output_file]
+
+    size_mb = sum(o.stat().st_size for o in outputs) / (1024 * 1024)
     print("\nAggregation complete")
     print(f"✅ Parsed: {counts['total_parsed']}  |  ⚠️ Skipped: {counts['total_skipped']}  |  "
-          f"📄 Out: {output_file}  ({size_mb:.2f} MB)")
+          f"📄 Out: {', '.join(map(str, outputs))}  ({size_mb:.2f} MB)")
     if group_meta:
         print("\nPer-group (domain) summary:")
-        for g in sorted(group_meta):
-            gm = group_meta[g]
+        for g, gm in group_meta.items():
             print(f" - {g}: in-window {gm['found_in_window']}, parsed {gm['parsed']}, skipped {gm['skipped']}")
     if skipped_files:
         print("\nFirst few errors:")
@@ -185,7 +527,11 @@ def aggregate_logs(
 
     return output_file
 
-def create_ai_prompt_file(aggregated_file: Path, prompt_file: Path = Path("ai_analysis_prompt.txt")) -> Path:
+def create_ai_prompt_file(
+    aggregated_file: Path,
+    prompt_file: Path = Path("ai_analysis_prompt.txt"),
+    extra_files: Sequence[Path] = (),
+) -> Path:
     prompt = """Please analyze these practice logs and provide:
 
 1) SUMMARY: key statistics and overview
@@ -195,12 +541,15 @@ def create_ai_prompt_file(aggregated_file: Path, prompt_file: Path = Path("ai_an
 
 Aggregated data follows:
 """
-    with open(aggregated_file, "r", encoding="utf-8") as f:
-        json_content = f.read()
-
-    with open(prompt_file, "w", encoding="utf-8") as f:
-        f.write(prompt)
-        f.write(json_content)
+    # Copy the aggregated bytes straight through; no need to decode them.
+    with open(prompt_file, "wb") as out:
+        out.write(prompt.encode("utf-8"))
+        with open(aggregated_file, "rb") as src:
+            shutil.copyfileobj(src, out, length=1 << 20)
+        for extra in extra_files:
+            out.write(b"\n")
+            with open(extra, "rb") as src:
+                shutil.copyfileobj(src, out, length=1 << 20)
 
     size_mb = prompt_file.stat().st_size / (1024 * 1024)
     print(f"🤖 AI analysis prompt created: {prompt_file}  ({size_mb:.2f} MB)")
@@ -209,13 +558,27 @@ Aggregated data follows:
     return prompt_file
 
 def parse_args() -> argparse.Namespace:
-    p = argparse.ArgumentParser(description="Aggregate JSON logs from subdirectories, grouped by domain, limited to last N months.")
+    p = argparse.ArgumentParser(description="Aggregate JSON logs from subdirectories, grouped by domain, limited to last N months "
+                                            "(or all dates with --no-enforce-date-path).")
     p.add_argument("repo", nargs="?", default=".", help="Path to repo root (default: .)")
     p.add_argument("-o", "--output", default="aggregated_logs.json", help="Output JSON file path")
     p.add_argument("-x", "--exclude", action="append", default=[], help="Directory name to exclude (may repeat)")
     p.add_argument("--follow-symlinks", action="store_true", help="Follow directory symlinks")
     p.add_argument("--no-prompt", action="store_true", help="Do not generate ai_analysis_prompt.txt")
     p.add_argument("--months", type=int, default=3, help="How many months back from today to include (default: 3)")
+    p.add_argument("--enforce-date-path", action=argparse.BooleanOptionalAction, default=True,
+                   help="Require [domain]/YYYY/MM/DD.json paths and apply --months (default: on); "
+                        "with --no-enforce-date-path every JSON file below a top-level folder is included, "
+                        "--months is ignored, no path-mismatch skips are recorded, and "
+                        "total_within_window counts every file found")
+    p.add_argument("-j", "--workers", type=int, default=1,
+                   help="Worker processes for parsing files (default: 1, i.e. in-process; 0 = one per CPU)")
+    p.add_argument("--cache", default=None,
+                   help="Cache of encoded items, reused when a file is unchanged "
+                        "(default: the output path plus .cache)")
+    p.add_argument("--no-cache", action="store_true", help="Do not read or write the parse cache")
+    p.add_argument("--ndjson", action="store_true",
+                   help="Write metadata to the output file and items, one per line, to a .groups.ndjson sidecar")
     return p.parse_args()
 
 def main() -> None:
@@ -230,9 +593,13 @@ def main() -> None:
         excludes=excludes,
         follow_symlinks=args.follow_symlinks,
         months=max(1, args.months),
+        workers=max(0, args.workers),
+        cache_file=None if args.no_cache else Path(args.cache) if args.cache else cache_path(output),
+        ndjson=args.ndjson,
+        enforce_date_path=args.enforce_date_path,
     )
     if not args.no_prompt:
-        create_ai_prompt_file(out)
+        create_ai_prompt_file(out, extra_files=[ndjson_path(out)] if args.ndjson else ())
 
     print("\nNext:")
     print("  - Validate metadata.window_* and metadata.groups")